@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Set, Dict
+from typing import List, Set, Dict, Optional
 
 @dataclass
 class GitConfig:
@@ -9,6 +9,7 @@ class GitConfig:
     end_date: datetime
     author_aliases: dict = field(default_factory=dict)
     excluded_authors: set = field(default_factory=set)
+    max_workers: Optional[int] = None  # Defaults to os.cpu_count()
 
 @dataclass
 class RepositoryConfig:
@@ -16,6 +17,8 @@ class RepositoryConfig:
     excluded_paths: set = field(default_factory=set)
     min_repo_depth: int = 3
     max_repo_depth: int = 5
+    use_cache: bool = True
+    cache_dir: Path = Path.home() / ".cache" / "git_contribution_analyzer"
 
 @dataclass
 class VisualizationConfig:
@@ -23,5 +26,6 @@ class VisualizationConfig:
     top_n_repos: int = 20
     graph_width: int = 15
     graph_height: int = 8
+    graph_dpi: int = 150
     graph_title: str = "Monthly Contribution Activity"
     output_dir: Path = Path("reports")
@@ -1,15 +1,77 @@
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from ..config.config import GitConfig, RepositoryConfig, VisualizationConfig
+from ..services.cache_service import RepositoryCacheService
 from ..services.git_service import GitService
 from ..services.report_service import ReportService
 from ..services.visualization_service import VisualizationService
 
+
+class _LogCollector(logging.Handler):
+    """Logging handler that keeps records so a worker can hand them back to the parent."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Render the message now so the record pickles cleanly
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+def _analyze_one(repo_path: Path, is_base_path: bool,
+                 git_config: GitConfig) -> Tuple[pd.DataFrame, List[logging.LogRecord]]:
+    """Gather statistics for a single repository in a worker process.
+
+    Log output is collected and returned with the result instead of being
+    written directly, so messages from parallel workers don't interleave.
+    """
+    package_logger = logging.getLogger(__name__.split('.')[0])
+    collector = _LogCollector()
+    previous_level = package_logger.level
+    package_logger.addHandler(collector)
+    package_logger.setLevel(logging.DEBUG)
+    package_logger.propagate = False
+
+    logger = logging.getLogger(__name__)
+    repo_name = repo_path.name
+    repo_stats = pd.DataFrame()
+    try:
+        # Base paths were just checked with git rev-parse (and may be a subdirectory
+        # of a work tree); discovered repositories get a cheap .git check, which
+        # also catches a repository removed since it was cached
+        if not is_base_path and not (repo_path / '.git').exists():
+            logger.info(f"Not a git repository: {repo_path}")
+            logger.info(f"No commits found in {repo_name}\n")
+        else:
+            repo_stats = GitService(git_config).get_repository_stats(repo_path)
+            if not repo_stats.empty:
+                logger.info(f"Successfully analyzed {repo_name}\n")
+            else:
+                logger.info(f"No commits found in {repo_name}\n")
+
+    except Exception as e:
+        logger.error(f"Error processing {repo_name}: {str(e)}\n")
+
+    finally:
+        package_logger.removeHandler(collector)
+        package_logger.setLevel(previous_level)
+        package_logger.propagate = True
+
+    return repo_stats, collector.records
+
+
 class GitContributionAnalyzer:
     def __init__(
         self,
@@ -22,6 +84,7 @@ class GitContributionAnalyzer:
         self.viz_config = viz_config
         
         self.git_service = GitService(git_config)
+        self.cache_service = RepositoryCacheService(repo_config)
         self.report_service = ReportService()
         self.viz_service = VisualizationService(viz_config)
         
@@ -35,34 +98,27 @@ class GitContributionAnalyzer:
 
         # Find repositories
         repositories = self._find_repositories()
-        self.logger.info("Checking repositories:")
-        for repo_path in repositories:
-            status = "Valid Git Repository" if self.git_service.is_git_repository(repo_path) else "Not a Git Repository"
-            self.logger.info(f"- {repo_path} ({status})")
         self.logger.info("")
 
         # Gather statistics
         self.logger.info("Gathering statistics...\n")
         stats_data = []
-        for i, repo_path in enumerate(repositories, 1):
-            repo_name = repo_path.name
-            self.logger.info(f"Processing repository {i}/{len(repositories)}: {repo_name}")
-            
-            try:
-                if not self.git_service.is_git_repository(repo_path):
-                    self.logger.info(f"Not a git repository: {repo_path}")
-                    self.logger.info(f"No commits found in {repo_name}\n")
-                    continue
+        analyze_one = partial(_analyze_one, git_config=self.git_config)
+        max_workers = self.git_config.max_workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            base_paths = set(self.repo_config.base_paths)
+            results = executor.map(
+                analyze_one, repositories, [repo_path in base_paths for repo_path in repositories]
+            )
+            for i, (repo_path, (repo_stats, records)) in enumerate(zip(repositories, results), 1):
+                self.logger.info(f"Processing repository {i}/{len(repositories)}: {repo_path.name}")
+                for record in records:
+                    logger = logging.getLogger(record.name)
+                    if logger.isEnabledFor(record.levelno):
+                        logger.handle(record)
 
-                repo_stats = self.git_service.get_repository_stats(repo_path)
                 if not repo_stats.empty:
                     stats_data.append(repo_stats)
-                    self.logger.info(f"Successfully analyzed {repo_name}\n")
-                else:
-                    self.logger.info(f"No commits found in {repo_name}\n")
-
-            except Exception as e:
-                self.logger.error(f"Error processing {repo_name}: {str(e)}\n")
 
         if not stats_data:
             self.logger.error("No data found in any repository.")
@@ -70,13 +126,20 @@ class GitContributionAnalyzer:
 
         # Combine all stats
         combined_stats = pd.concat(stats_data, ignore_index=True)
+        # Per-repository categories differ, so concat falls back to object dtype
+        combined_stats['author'] = combined_stats['author'].astype('category')
+        combined_stats['repository'] = combined_stats['repository'].astype('category')
 
-        # Generate reports
+        # Generate reports and the visualization concurrently; both mostly wait on
+        # disk writes or C code that releases the GIL
         self.logger.info("Generating reports...\n")
-        self.report_service.generate_reports(combined_stats, self.viz_config.output_dir)
-        
-        # Create visualization
-        self.viz_service.generate_visualizations(combined_stats, self.viz_config.output_dir)
+        self.viz_config.output_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            visualization = executor.submit(
+                self.viz_service.generate_visualizations, combined_stats, self.viz_config.output_dir
+            )
+            self.report_service.generate_reports(combined_stats, self.viz_config.output_dir)
+            visualization.result()
 
     def _find_repositories(self) -> List[Path]:
         """Find all Git repositories in the configured base paths."""
@@ -94,22 +157,65 @@ class GitContributionAnalyzer:
                 self.logger.info(f"Found Git repository at base path: {base_path}")
                 continue
 
-            # Search for repositories in subdirectories
-            for path in base_path.rglob('.git'):
-                repo_path = path.parent
-                
-                # Check repository depth
-                depth = len(repo_path.relative_to(base_path).parts)
-                if depth < self.repo_config.min_repo_depth or depth > self.repo_config.max_repo_depth:
-                    self.logger.debug(f"Skipping {repo_path} due to depth {depth}")
-                    continue
-
-                # Check if path is excluded
-                if any(excl in str(repo_path) for excl in self.repo_config.excluded_paths):
-                    self.logger.debug(f"Skipping excluded path: {repo_path}")
-                    continue
-
+            # Reuse the cached repository list if nothing under the base path changed
+            found = self.cache_service.load(base_path) if self.repo_config.use_cache else None
+            if found is not None:
+                self.logger.info(f"Using cached repository list for {base_path}")
+            else:
+                # Search for repositories in subdirectories
+                dir_mtimes = {}
+                found = list(self._walk_repositories(base_path, dir_mtimes))
+                if self.repo_config.use_cache:
+                    self.cache_service.save(base_path, found, dir_mtimes)
+
+            for repo_path in found:
                 repositories.append(repo_path)
                 self.logger.info(f"Found Git repository: {repo_path}")
 
         return sorted(repositories)
+
+    def _walk_repositories(self, base_path: Path,
+                           dir_mtimes: Optional[Dict[str, int]] = None) -> Iterator[Path]:
+        """Walk base_path with os.scandir, yielding Git repositories within the configured depth.
+
+        Excluded directories and anything below max_repo_depth are pruned
+        before descending, and the walk doesn't descend into a repository
+        once it has been found. If dir_mtimes is given, it is filled with the
+        mtime of every directory listed, repositories included, for the
+        repository cache.
+        """
+        min_depth = self.repo_config.min_repo_depth
+        max_depth = self.repo_config.max_repo_depth
+        excluded_paths = self.repo_config.excluded_paths
+
+        stack = [(str(base_path), 0)]
+        while stack:
+            dir_path, depth = stack.pop()
+            subdirs = []
+            is_repo = False
+            try:
+                mtime_ns = os.stat(dir_path).st_mtime_ns
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.name == '.git':
+                            is_repo = True
+                        elif depth < max_depth and entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+            except OSError as e:
+                self.logger.debug(f"Skipping unreadable directory {dir_path}: {str(e)}")
+                continue
+
+            # Record repositories too, so removing one's .git invalidates the cache
+            if dir_mtimes is not None:
+                dir_mtimes[dir_path] = mtime_ns
+
+            if is_repo and depth >= min_depth:
+                yield Path(dir_path)
+                continue
+
+            for subdir in subdirs:
+                # Check if path is excluded
+                if any(excl in subdir for excl in excluded_paths):
+                    self.logger.debug(f"Skipping excluded path: {subdir}")
+                    continue
+                stack.append((subdir, depth + 1))
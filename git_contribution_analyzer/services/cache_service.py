@@ -0,0 +1,75 @@
+"""Service for caching discovered Git repositories between runs."""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..config.config import RepositoryConfig
+
+class RepositoryCacheService:
+    """Service for caching the repository list found under each base path.
+
+    A cached entry stores the modification time of every directory the
+    discovery walk listed. Adding or removing an entry in any of those
+    directories changes its mtime, so the entry is reused only while the
+    scanned tree is unchanged.
+    """
+
+    def __init__(self, config: RepositoryConfig):
+        """Initialize the cache service."""
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self._entries: Optional[Dict[str, dict]] = None
+
+    @property
+    def cache_file(self) -> Path:
+        """Cache file for the current discovery settings."""
+        key = json.dumps([
+            sorted(str(path) for path in self.config.base_paths),
+            self.config.min_repo_depth,
+            self.config.max_repo_depth,
+            sorted(self.config.excluded_paths)
+        ])
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return self.config.cache_dir / f"repos_{digest}.json"
+
+    def load(self, base_path: Path) -> Optional[List[Path]]:
+        """Get the cached repositories for a base path, or None if missing or stale."""
+        entry = self._load_entries().get(str(base_path))
+        if not entry:
+            return None
+
+        for dir_path, mtime_ns in entry['mtimes'].items():
+            try:
+                if os.stat(dir_path).st_mtime_ns != mtime_ns:
+                    return None
+            except OSError:
+                return None
+
+        return [Path(repo) for repo in entry['repositories']]
+
+    def save(self, base_path: Path, repositories: List[Path], dir_mtimes: Dict[str, int]) -> None:
+        """Store the repositories found under a base path with the directory mtimes seen."""
+        entries = self._load_entries()
+        entries[str(base_path)] = {
+            'repositories': [str(repo) for repo in repositories],
+            'mtimes': dir_mtimes
+        }
+        try:
+            self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+        except OSError as e:
+            self.logger.debug(f"Could not write repository cache {self.cache_file}: {str(e)}")
+
+    def _load_entries(self) -> Dict[str, dict]:
+        """Read the cache file once per run."""
+        if self._entries is None:
+            try:
+                with open(self.cache_file, encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
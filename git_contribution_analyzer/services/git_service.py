@@ -1,13 +1,49 @@
 import logging
+import re
 import subprocess
-from datetime import datetime
+import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..config.config import GitConfig
 
+# git log output is NUL-delimited (--numstat -z); each commit header holds the
+# hash, author date and author name separated by the ASCII unit separator
+FIELD_SEP = b'\x1f'
+LOG_FORMAT = '%x00%H%x1f%ad%x1f%an%x00'
+
+
+# Excluded authors are also filtered by git itself (--author) when there are only a few
+MAX_GIT_AUTHOR_EXCLUSIONS = 20
+
+# Whether this git build supports --perl-regexp, probed once per process
+_perl_regexp_supported: Optional[bool] = None
+
+
+def _iter_records(stream: BinaryIO, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """Yield NUL-terminated records from a byte stream without reading it all at once."""
+    pending = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        records = (pending + chunk).split(b'\x00')
+        pending = records.pop()
+        yield from records
+    if pending:
+        yield pending
+
+
+def _sum_numstat(commit_index: List[int], counts: List[bytes], n_commits: int) -> np.ndarray:
+    """Sum numstat line counts per commit, parsing all count strings in one numpy call."""
+    totals = np.zeros(n_commits, dtype=np.int64)
+    np.add.at(totals, np.asarray(commit_index, dtype=np.intp), np.array(counts).astype(np.int64))
+    return totals
+
+
 class GitService:
     def __init__(self, config: GitConfig):
         self.config = config
@@ -31,103 +67,140 @@ class GitService:
     def get_repository_stats(self, repo_path: Path) -> pd.DataFrame:
         """Get Git statistics for a repository."""
         try:
-            # Get list of commits
+            # Get commits and their numstat in a single git log call
             git_log_cmd = [
-                'git', 'log',
+                'git', 'log', '--numstat', '-z', '--diff-merges=first-parent',
                 f'--since={self.config.start_date.strftime("%Y-%m-%d")}',
                 f'--until={self.config.end_date.strftime("%Y-%m-%d")}',
-                '--format=%H|%ad|%an',
-                '--date=format:%Y-%m-%d'
+                f'--format={LOG_FORMAT}',
+                '--date=format:%Y-%m-%d',
+                *self._author_filter_args(repo_path)
             ]
             
-            result = subprocess.run(
+            dates, authors, hashes = [], [], []
+            # Numstat counts stay raw bytes here and are summed per commit in one
+            # vectorized pass once the log has been read
+            stat_commits, stat_added, stat_deleted = [], [], []
+            in_commit = False
+            after_separator = False
+            rename_paths = 0
+            # Stream git log output so large histories are never held in memory at once
+            # stderr goes to a temp file: a pipe read only after stdout is drained
+            # would deadlock once git writes more than a pipe buffer of warnings
+            with tempfile.TemporaryFile() as stderr_file, subprocess.Popen(
                 git_log_cmd,
                 cwd=str(repo_path),
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            if result.returncode != 0:
-                self.logger.error(f"Error getting git log for {repo_path}: {result.stderr}")
-                return pd.DataFrame()
+                stderr=stderr_file
+            ) as proc:
+                for record in _iter_records(proc.stdout):
+                    # Renames and copies list the old and new paths as separate records
+                    if rename_paths:
+                        rename_paths -= 1
+                        continue
 
-            commits = []
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                    
-                try:
-                    commit_hash, date_str, author = line.strip().split('|')
-                    author = author.lower()
-                    
-                    # Skip excluded authors
-                    if author in self.config.excluded_authors:
+                    # Headers are framed by empty records; numstat output starts with a newline
+                    if not record:
+                        after_separator = True
                         continue
-                        
-                    # Apply author aliases
-                    author = self.config.author_aliases.get(author, author)
-                    
-                    # Get commit stats
-                    stats = self._get_commit_stats(commit_hash, repo_path)
-                    if stats:
-                        commits.append({
-                            'date': datetime.strptime(date_str, '%Y-%m-%d'),
-                            'author': author,
-                            'hash': commit_hash,
-                            'additions': stats['additions'],
-                            'deletions': stats['deletions'],
-                            'repository': repo_path.name
-                        })
-                except Exception as e:
-                    self.logger.error(f"Error parsing commit line: {str(e)}")
-                    continue
-
-            if not commits:
+                    is_header = after_separator and not record.startswith(b'\n')
+                    after_separator = False
+
+                    if is_header:
+                        commit_hash, date_str, author = record.split(FIELD_SEP, 2)
+                        author = author.decode('utf-8', errors='replace').lower()
+
+                        # Skip excluded authors
+                        if author in self.config.excluded_authors:
+                            in_commit = False
+                            continue
+
+                        # Apply author aliases
+                        author = self.config.author_aliases.get(author, author)
+
+                        dates.append(date_str.decode('ascii'))
+                        authors.append(author)
+                        hashes.append(commit_hash.decode('ascii'))
+                        in_commit = True
+                        continue
+
+                    # The first numstat record of a commit follows a newline
+                    record = record.lstrip(b'\n')
+                    if not record:
+                        continue
+                    added, _, rest = record.partition(b'\t')
+                    deleted, _, path = rest.partition(b'\t')
+                    if not path:
+                        rename_paths = 2
+
+                    if in_commit and added != b'-' and deleted != b'-':  # Skip binary files
+                        stat_commits.append(len(hashes) - 1)
+                        stat_added.append(added)
+                        stat_deleted.append(deleted)
+
+                if proc.wait() != 0:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode('utf-8', errors='replace')
+                    self.logger.error(f"Error getting git log for {repo_path}: {stderr}")
+                    return pd.DataFrame()
+
+            if not hashes:
                 self.logger.info(f"No commits found in {repo_path.name}")
                 return pd.DataFrame()
 
-            return pd.DataFrame(commits)
+            additions = _sum_numstat(stat_commits, stat_added, len(hashes))
+            deletions = _sum_numstat(stat_commits, stat_deleted, len(hashes))
+
+            # Build the frame column-wise rather than from a list of per-commit dicts.
+            # Dates stay raw strings in the loop and are parsed in one vectorized
+            # call; the cache helps since many commits share the same day.
+            return pd.DataFrame({
+                'date': pd.to_datetime(dates, format='%Y-%m-%d', cache=True),
+                'author': pd.Categorical(authors),
+                'hash': hashes,
+                'additions': additions.astype(np.int32),
+                'deletions': deletions.astype(np.int32),
+                'repository': pd.Categorical([repo_path.name] * len(hashes))
+            })
 
         except Exception as e:
             self.logger.error(f"Error getting stats for {repo_path}: {str(e)}")
             return pd.DataFrame()
 
-    def _get_commit_stats(self, commit_hash: str, repo_path: Path) -> Optional[dict]:
-        """Get the number of additions and deletions for a commit."""
-        try:
+    def _author_filter_args(self, repo_path: Path) -> List[str]:
+        """Build git log arguments that drop excluded authors before they are streamed.
+
+        Only entries git can match exactly like the Python-side check are pushed
+        down: that check compares the lowercased raw author name, so entries with
+        uppercase characters never match there, and non-ASCII entries could case
+        fold differently in git's regex engine. The mailmap is disabled so git
+        matches the same raw name that %an prints.
+        """
+        excluded = [
+            author for author in self.config.excluded_authors
+            if author == author.lower() and author.isascii()
+        ]
+        if not excluded or len(excluded) >= MAX_GIT_AUTHOR_EXCLUSIONS:
+            return []
+        if not self._supports_perl_regexp(repo_path):
+            return []
+
+        # --author matches "Name <email>"; reject lines whose name is an excluded author
+        names = '|'.join(re.escape(author) for author in sorted(excluded))
+        return [
+            '--no-use-mailmap', '--perl-regexp', '--regexp-ignore-case',
+            f'--author=^(?!(?:{names}) <)'
+        ]
+
+    def _supports_perl_regexp(self, repo_path: Path) -> bool:
+        """Check whether git was built with PCRE support for --perl-regexp."""
+        global _perl_regexp_supported
+        if _perl_regexp_supported is None:
             result = subprocess.run(
-                ['git', 'show', '--numstat', '--format=', commit_hash],
+                ['git', 'log', '--all', '--perl-regexp', '--author=^', '-n', '0'],
                 cwd=str(repo_path),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
-            
-            if result.returncode != 0:
-                self.logger.error(f"Error getting commit stats: {result.stderr}")
-                return None
-
-            additions = 0
-            deletions = 0
-            
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                    
-                try:
-                    added, deleted, _ = line.split('\t')
-                    if added != '-' and deleted != '-':  # Skip binary files
-                        additions += int(added)
-                        deletions += int(deleted)
-                except ValueError:
-                    continue
-
-            return {
-                'additions': additions,
-                'deletions': deletions
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error getting commit stats: {str(e)}")
-            return None
+            _perl_regexp_supported = result.returncode == 0
+        return _perl_regexp_supported
@@ -1,9 +1,22 @@
 """Service for generating Git contribution reports."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
 from ..config.output import REPORT_PATHS
 
+# Separator lines for the detailed text report
+SECTION_RULE = "=" * 80 + "\n"
+SUBSECTION_RULE = "-" * 50 + "\n"
+
 class ReportService:
     """Service for generating Git contribution reports."""
 
@@ -28,58 +41,68 @@ class ReportService:
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate author summary
-        author_summary = self._generate_author_summary(df)
-        author_summary.to_csv(
-            output_dir / REPORT_PATHS['author_summary'].name.format(
-                start_date=start_date, end_date=end_date
-            )
-        )
+        # Aggregate once; the summaries below are rolled up from this table
+        grouped = self._aggregate(df)
 
-        # Generate daily activity
-        daily_activity = self._generate_daily_activity(df)
-        daily_activity.to_csv(
-            output_dir / REPORT_PATHS['daily_activity'].name.format(
-                start_date=start_date, end_date=end_date
-            )
-        )
+        author_summary = self._generate_author_summary(grouped)
+        daily_activity = self._generate_daily_activity(grouped)
+        repo_summary = self._generate_repository_summary(grouped)
 
-        # Generate repository summary
-        repo_summary = self._generate_repository_summary(df)
-        repo_summary.to_csv(
-            output_dir / REPORT_PATHS['repository_summary'].name.format(
+        def output_file(report: str) -> Path:
+            return output_dir / REPORT_PATHS[report].name.format(
                 start_date=start_date, end_date=end_date
             )
-        )
 
-        # Generate detailed report
-        self._generate_detailed_report(
-            df, author_summary, daily_activity, repo_summary,
-            output_dir / REPORT_PATHS['detailed_report'].name.format(
-                start_date=start_date, end_date=end_date
-            )
+        # Writes are IO-bound (or run in C++ with the GIL released), so run them together
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._write_csv, author_summary, output_file('author_summary')),
+                executor.submit(self._write_csv, daily_activity, output_file('daily_activity')),
+                executor.submit(self._write_csv, repo_summary, output_file('repository_summary')),
+                executor.submit(
+                    self._generate_detailed_report,
+                    df, author_summary, daily_activity, repo_summary,
+                    output_file('detailed_report')
+                )
+            ]
+            for future in futures:
+                future.result()
+
+    def _write_csv(self, df: pd.DataFrame, output_file: Path):
+        """Write a report with its index to CSV, using PyArrow's C++ writer when available."""
+        if pacsv is None:
+            df.to_csv(output_file)
+            return
+
+        table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+        # Report dates are whole days; write them as plain dates like pandas does
+        for i, column in enumerate(table.schema):
+            if pa.types.is_timestamp(column.type):
+                table = table.set_column(i, column.name, table.column(i).cast(pa.date32()))
+
+        # PyArrow quotes string fields; readers parse the same values as pandas' output
+        pacsv.write_csv(table, str(output_file))
+
+    def _aggregate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate commits and line changes per repository, author and date."""
+        return df.groupby(['repository', 'author', 'date'], observed=True, sort=False).agg(
+            commits=('hash', 'count'),
+            additions=('additions', 'sum'),
+            deletions=('deletions', 'sum')
         )
 
-    def _generate_author_summary(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _generate_author_summary(self, grouped: pd.DataFrame) -> pd.DataFrame:
         """Generate author summary report."""
-        summary = df.groupby('author').agg({
-            'hash': 'count',
-            'additions': 'sum',
-            'deletions': 'sum'
-        }).rename(columns={'hash': 'commits'})
+        summary = grouped.groupby(level='author', observed=True).sum()
         
         summary['total_lines'] = summary['additions'] + summary['deletions']
         summary = summary.sort_values('commits', ascending=False)
         
         return summary
 
-    def _generate_daily_activity(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _generate_daily_activity(self, grouped: pd.DataFrame) -> pd.DataFrame:
         """Generate daily activity report."""
-        daily = df.groupby(['date', 'author']).agg({
-            'hash': 'count',
-            'additions': 'sum',
-            'deletions': 'sum'
-        }).rename(columns={'hash': 'commits'})
+        daily = grouped.groupby(level=['date', 'author'], observed=True).sum()
         
         # Sort by date and commits within each date
         daily = daily.reset_index().sort_values(['date', 'commits'], ascending=[True, False])
@@ -87,18 +110,14 @@ class ReportService:
         
         return daily
 
-    def _generate_repository_summary(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _generate_repository_summary(self, grouped: pd.DataFrame) -> pd.DataFrame:
         """Generate repository summary report."""
-        repo_summary = df.groupby(['repository', 'author']).agg({
-            'hash': 'count',
-            'additions': 'sum',
-            'deletions': 'sum'
-        }).rename(columns={'hash': 'commits'})
+        repo_summary = grouped.groupby(level=['repository', 'author'], observed=True).sum()
         
         # Sort repositories by total commits and authors within repositories by commits
         repo_summary = repo_summary.reset_index()
-        repo_totals = repo_summary.groupby('repository')['commits'].sum()
-        repo_summary['repo_total_commits'] = repo_summary['repository'].map(repo_totals)
+        repo_summary['repo_total_commits'] = repo_summary.groupby(
+            'repository', observed=True)['commits'].transform('sum')
         repo_summary = repo_summary.sort_values(['repo_total_commits', 'commits'], ascending=[False, False])
         repo_summary = repo_summary.drop('repo_total_commits', axis=1)
         repo_summary = repo_summary.set_index(['repository', 'author'])
@@ -109,52 +128,57 @@ class ReportService:
                                 daily_activity: pd.DataFrame, repo_summary: pd.DataFrame,
                                 output_file: Path):
         """Generate a detailed text report combining all statistics."""
+        # Build the report in memory and write it in one call
+        lines = [
+            SECTION_RULE, "DETAILED CONTRIBUTION REPORT\n", SECTION_RULE, "\n",
+            "1. TOP 10 CONTRIBUTORS BY TOTAL IMPACT\n", SUBSECTION_RULE, "\n"
+        ]
+
+        # Top 10 Contributors
+        for author in author_summary.head(10).index:
+            stats = author_summary.loc[author]
+            lines.append(
+                f"{author}:\n"
+                f"  Commits: {stats['commits']:,}\n"
+                f"  Lines Added: {stats['additions']:,}\n"
+                f"  Lines Deleted: {stats['deletions']:,}\n"
+                f"  Total Lines Modified: {stats['total_lines']:,}\n\n"
+            )
+
+        # Monthly Activity
+        lines.extend(["2. MONTHLY ACTIVITY\n", SUBSECTION_RULE, "\n"])
+        # Bin dates to months once and walk the groups instead of filtering per month
+        month_key = df['date'].values.astype('datetime64[M]')
+        for month, month_df in df.groupby(month_key, sort=True):
+            lines.append(
+                f"{month.strftime('%Y-%m')}:\n"
+                f"  Total Commits: {month_df['hash'].count()}\n"
+                "  Top Contributors:\n"
+            )
+
+            # Top contributors for the month
+            month_contributors = month_df.groupby('author', observed=True)['hash'].count()
+            for author, commits in month_contributors.sort_values(ascending=False).head(3).items():
+                lines.append(f"    - {author}: {commits} commits\n")
+            lines.append("\n")
+
+        # Repository Activity
+        lines.extend(["3. REPOSITORY ACTIVITY\n", SUBSECTION_RULE, "\n"])
+        repo_groups = df.groupby('repository', observed=True)
+        repo_totals = repo_groups['hash'].count().sort_values(ascending=False)
+
+        for repo in repo_totals.index:
+            lines.append(
+                f"{repo}:\n"
+                f"  Total Commits: {repo_totals[repo]}\n"
+                "  Top Contributors:\n"
+            )
+
+            # Top contributors for the repository
+            repo_contributors = repo_groups.get_group(repo).groupby('author', observed=True)['hash'].count()
+            for author, commits in repo_contributors.sort_values(ascending=False).head(2).items():
+                lines.append(f"    - {author}: {commits} commits\n")
+            lines.append("\n")
+
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("DETAILED CONTRIBUTION REPORT\n")
-            f.write("=" * 80 + "\n\n")
-
-            # Top 10 Contributors
-            f.write("1. TOP 10 CONTRIBUTORS BY TOTAL IMPACT\n")
-            f.write("-" * 50 + "\n\n")
-            for author in author_summary.head(10).index:
-                stats = author_summary.loc[author]
-                f.write(f"{author}:\n")
-                f.write(f"  Commits: {stats['commits']:,}\n")
-                f.write(f"  Lines Added: {stats['additions']:,}\n")
-                f.write(f"  Lines Deleted: {stats['deletions']:,}\n")
-                f.write(f"  Total Lines Modified: {stats['total_lines']:,}\n\n")
-
-            # Monthly Activity
-            f.write("2. MONTHLY ACTIVITY\n")
-            f.write("-" * 50 + "\n\n")
-            monthly = df.groupby([df['date'].dt.strftime('%Y-%m')]).agg({
-                'hash': 'count'
-            }).rename(columns={'hash': 'commits'})
-
-            for month in monthly.index:
-                f.write(f"{month}:\n")
-                f.write(f"  Total Commits: {monthly.loc[month, 'commits']}\n")
-                
-                # Top contributors for the month
-                month_contributors = df[df['date'].dt.strftime('%Y-%m') == month].groupby('author')['hash'].count()
-                f.write("  Top Contributors:\n")
-                for author, commits in month_contributors.sort_values(ascending=False).head(3).items():
-                    f.write(f"    - {author}: {commits} commits\n")
-                f.write("\n")
-
-            # Repository Activity
-            f.write("3. REPOSITORY ACTIVITY\n")
-            f.write("-" * 50 + "\n\n")
-            repo_totals = df.groupby('repository')['hash'].count().sort_values(ascending=False)
-            
-            for repo in repo_totals.index:
-                f.write(f"{repo}:\n")
-                f.write(f"  Total Commits: {repo_totals[repo]}\n")
-                
-                # Top contributors for the repository
-                repo_contributors = df[df['repository'] == repo].groupby('author')['hash'].count()
-                f.write("  Top Contributors:\n")
-                for author, commits in repo_contributors.sort_values(ascending=False).head(2).items():
-                    f.write(f"    - {author}: {commits} commits\n")
-                f.write("\n")
+            f.write(''.join(lines))
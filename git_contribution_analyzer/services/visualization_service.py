@@ -2,8 +2,10 @@
 import logging
 from pathlib import Path
 import pandas as pd
-import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.artist import setp
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from datetime import datetime
 
 from ..config.config import VisualizationConfig
@@ -32,48 +34,51 @@ class VisualizationService:
         end_date = stats_df['date'].max()
         date_range = pd.date_range(start=start_date, end=end_date, freq='ME')
 
-        # Create monthly contribution graph with all months
-        monthly_commits = stats_df.groupby([
-            pd.Grouper(key='date', freq='ME'),
-            'author'
-        ])['hash'].count().reset_index()
-
         # Get top contributors for better visualization
-        top_authors = stats_df.groupby('author')['hash'].count().nlargest(self.config.top_n_contributors).index
+        top_authors = stats_df.groupby('author', observed=True)['hash'].count().nlargest(self.config.top_n_contributors).index
+
+        # Build the monthly commit matrix for all months and top authors in one pass
+        monthly_commits = stats_df.pivot_table(
+            index=pd.Grouper(key='date', freq='ME'),
+            columns='author',
+            values='hash',
+            aggfunc='count',
+            fill_value=0,
+            observed=True
+        )
+        monthly_commits = monthly_commits.reindex(index=date_range, columns=top_authors, fill_value=0)
 
         # Create the visualization
-        plt.figure(figsize=(self.config.graph_width, self.config.graph_height))
+        # Figure/canvas objects rather than pyplot: the Agg canvas renders without
+        # touching the global backend, and pyplot's figure manager is not
+        # thread-safe while this runs alongside report generation
+        fig = Figure(figsize=(self.config.graph_width, self.config.graph_height))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
         
         # Plot each author's contributions
         for author in top_authors:
-            author_data = monthly_commits[monthly_commits['author'] == author]
-            
-            # Create a DataFrame with all months
-            full_date_df = pd.DataFrame({'date': date_range})
-            author_data = pd.merge(full_date_df, author_data, on='date', how='left')
-            author_data['hash'] = author_data['hash'].fillna(0)
-            
-            plt.plot(author_data['date'], author_data['hash'], 
+            ax.plot(monthly_commits.index, monthly_commits[author].values, 
                     marker='o', label=author, linewidth=2, markersize=6)
 
         # Customize the plot
-        plt.title('Monthly Contribution Activity by Top Contributors', 
-                 fontsize=14, pad=20)
-        plt.xlabel('Month', fontsize=12)
-        plt.ylabel('Number of Commits', fontsize=12)
-        plt.grid(True, linestyle='--', alpha=0.7)
+        ax.set_title('Monthly Contribution Activity by Top Contributors', 
+                     fontsize=14, pad=20)
+        ax.set_xlabel('Month', fontsize=12)
+        ax.set_ylabel('Number of Commits', fontsize=12)
+        ax.grid(True, linestyle='--', alpha=0.7)
         
         # Format x-axis to show all months
-        plt.gca().xaxis.set_major_locator(mdates.MonthLocator())
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        plt.xticks(rotation=45, ha='right')
+        ax.xaxis.set_major_locator(mdates.MonthLocator())
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
         
         # Add legend
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left', 
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', 
                   borderaxespad=0., fontsize=10)
         
-        # Adjust layout to prevent label cutoff
-        plt.tight_layout()
+        # Adjust layout once to prevent label cutoff, so saving needs no extra bbox pass
+        fig.tight_layout()
 
         # Save the graph
         start_date = self._format_date(stats_df['date'].min())
@@ -82,7 +87,6 @@ class VisualizationService:
             start_date=start_date,
             end_date=end_date
         )
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(output_path, dpi=self.config.graph_dpi)
 
         self.logger.info(f"Generated contribution graph: {output_path}")
@@ -5,9 +5,13 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
+        "numpy",
         "pandas",
         "matplotlib",
     ],
+    extras_require={
+        "pyarrow": ["pyarrow"],
+    },
     author="Wavenet",
     description="A tool for analyzing git contributions across multiple repositories",
     python_requires=">=3.7",